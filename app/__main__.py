@@ -0,0 +1,44 @@
+"""
+Production entrypoint: run the API under gunicorn with one uvicorn worker
+per core.
+
+Usage: python -m app
+
+The application (and the pickled model) is loaded once in the gunicorn
+master process before workers fork, so the forest arrays are shared
+across workers via copy-on-write instead of being unpickled per process.
+"""
+
+import multiprocessing
+import os
+
+from gunicorn.app.base import BaseApplication
+
+
+class MLServer(BaseApplication):
+    """Programmatic gunicorn application for the prediction API."""
+
+    def __init__(self, workers=None):
+        self.workers = workers or multiprocessing.cpu_count()
+        super().__init__()
+
+    def load_config(self):
+        self.cfg.set("bind", f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+        self.cfg.set("workers", self.workers)
+        self.cfg.set("worker_class", "uvicorn.workers.UvicornWorker")
+        self.cfg.set("preload_app", True)
+
+    def load(self):
+        from app.main import app, model_loader
+
+        # Unpickle in the master so forked workers inherit the model pages
+        try:
+            model_loader.load_model()
+        except FileNotFoundError as e:
+            print(f"Warning: {e}")
+            print("Model will be loaded per worker on startup")
+        return app
+
+
+if __name__ == "__main__":
+    MLServer().run()
@@ -2,38 +2,148 @@
 FastAPI application for ML model prediction API.
 """
 
+import asyncio
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Tuple
 import numpy as np
-from app.model_loader import ModelLoader
+from app import model_loader
 
-# Initialize model loader
-model_loader = ModelLoader()
+# Iris class names indexed by predicted class
+_CLASS_NAMES = ("setosa", "versicolor", "virginica")
+
+# Micro-batching configuration: concurrent requests are collected into a
+# single predict_proba call to amortize sklearn's per-call overhead.
+MAX_BATCH_SIZE = 64
+BATCH_WAIT_SECONDS = 0.005
+
+# Queue of (features, future) pairs consumed by the batch worker.
+# Created lazily so it is bound to the running event loop.
+_batch_queue = None
+_batch_worker_task = None
+_batch_loop = None
+
+
+def _ensure_batch_worker():
+    """Create the batch queue and worker task on the current event loop."""
+    global _batch_queue, _batch_worker_task, _batch_loop
+    loop = asyncio.get_event_loop()
+    if _batch_loop is not loop or _batch_worker_task is None or _batch_worker_task.done():
+        _batch_loop = loop
+        _batch_queue = asyncio.Queue()
+        _batch_worker_task = asyncio.create_task(_batch_worker())
+
+
+async def _batch_worker():
+    """Background task that batches queued predictions into single model calls."""
+    # Reusable scratch buffer for batch assembly; safe because this worker is
+    # the sole consumer and the model call completes before the next refill
+    batch_buffer = np.empty((MAX_BATCH_SIZE, 4), dtype=np.float64)
+    while True:
+        # Block until at least one request arrives, then briefly wait for
+        # more so concurrent requests share one model call.
+        items = [await _batch_queue.get()]
+        deadline = asyncio.get_event_loop().time() + BATCH_WAIT_SECONDS
+        while len(items) < MAX_BATCH_SIZE:
+            remaining = deadline - asyncio.get_event_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                items.append(
+                    await asyncio.wait_for(_batch_queue.get(), timeout=remaining)
+                )
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            # The predict handler checks readiness before enqueueing, so the
+            # model is always set by the time a batch is assembled
+            model = app.state.model
+            # Fill the preallocated buffer by index to avoid per-request
+            # ndarray allocation and generic list-to-array coercion
+            for i, (features, _) in enumerate(items):
+                batch_buffer[i, 0] = features[0]
+                batch_buffer[i, 1] = features[1]
+                batch_buffer[i, 2] = features[2]
+                batch_buffer[i, 3] = features[3]
+            features_array = batch_buffer[:len(items)]
+            # Run the CPU-bound model call in a worker thread so the event
+            # loop keeps accepting requests (and filling the next batch)
+            # while sklearn traverses the forest
+            probabilities = await asyncio.to_thread(
+                model.predict_proba, features_array
+            )
+            predictions = np.argmax(probabilities, axis=1)
+            for i, (_, future) in enumerate(items):
+                if not future.cancelled():
+                    future.set_result((int(predictions[i]), probabilities[i]))
+        except Exception as e:
+            for _, future in items:
+                if not future.cancelled():
+                    future.set_exception(e)
+
+
+async def _predict_batched(features):
+    """Submit a feature vector to the batch worker and await its result."""
+    _ensure_batch_worker()
+    future = asyncio.get_event_loop().create_future()
+    await _batch_queue.put((features, future))
+    return await future
+
+
+def _get_ready_model():
+    """Return the loaded model, or None if it is not available.
+
+    Reads the readiness flag set in lifespan; when the app runs without
+    lifespan (e.g. under TestClient) the model is loaded lazily once and
+    the flag is set here instead.
+    """
+    model = getattr(app.state, "model", None)
+    if model is None:
+        try:
+            model = model_loader.load_model()
+        except FileNotFoundError:
+            model = None
+        app.state.model = model
+    return model
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown."""
     # Startup
+    # Avoid BLAS/OpenMP thread-pool contention when serving concurrent requests
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
     try:
-        model_loader.load_model()
+        model = model_loader.load_model()
         print("Model loaded successfully on startup")
+        # Warm up both the single-row and batched predict paths so first-request
+        # one-time costs (ufunc dispatch caches, Cython imports, thread pools)
+        # are paid before traffic arrives
+        model.predict_proba(np.zeros((1, 4), dtype=np.float64))
+        model.predict_proba(np.zeros((32, 4), dtype=np.float64))
+        app.state.model = model
     except FileNotFoundError as e:
         print(f"Warning: {e}")
         print("Model will be loaded on first prediction request")
+        app.state.model = None
+    _ensure_batch_worker()
     yield
-    # Shutdown (if needed in the future)
-    pass
+    # Shutdown
+    if _batch_worker_task is not None:
+        _batch_worker_task.cancel()
 
 
 app = FastAPI(
     title="ML Model API",
     description="API for Iris classifier predictions",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS to allow requests from browser (including file://)
@@ -48,11 +158,20 @@ app.add_middleware(
 
 class PredictionRequest(BaseModel):
     """Request model for prediction endpoint."""
-    features: List[float] = Field(
+    # Fixed-arity tuple compiles to a straight-line pydantic-core validator,
+    # cheaper than a generic list validator with length constraints
+    features: Tuple[float, float, float, float] = Field(
+        ...,
+        description="List of 4 features: [sepal_length, sepal_width, petal_length, petal_width]"
+    )
+
+
+class BatchPredictionRequest(BaseModel):
+    """Request model for batch prediction endpoint."""
+    features: List[Tuple[float, float, float, float]] = Field(
         ...,
-        description="List of 4 features: [sepal_length, sepal_width, petal_length, petal_width]",
-        min_length=4,
-        max_length=4
+        description="List of feature rows, each [sepal_length, sepal_width, petal_length, petal_width]",
+        min_length=1
     )
 
 
@@ -63,6 +182,11 @@ class PredictionResponse(BaseModel):
     class_name: str = Field(..., description="Name of the predicted class")
 
 
+class BatchPredictionResponse(BaseModel):
+    """Response model for batch prediction endpoint."""
+    predictions: List[PredictionResponse] = Field(..., description="Per-row prediction results")
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -71,6 +195,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "predict": "/predict",
+            "predict_batch": "/predict_batch",
             "health": "/health",
             "docs": "/docs"
         }
@@ -80,40 +205,15 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    try:
-        model = model_loader.get_model()
-        return {
-            "status": "healthy",
-            "model_loaded": model is not None
-        }
-    except Exception as e:
+    model = _get_ready_model()
+    if model is None:
         return {
             "status": "unhealthy",
-            "error": str(e)
+            "model_loaded": False
         }
-
-
-@app.get("/predict")
-async def predict_get():
-    """
-    GET endpoint for /predict - shows usage instructions.
-    Use POST method to make predictions.
-    """
     return {
-        "message": "This endpoint requires POST method",
-        "usage": {
-            "method": "POST",
-            "url": "/predict",
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": {
-                "features": [5.1, 3.5, 1.4, 0.2]
-            },
-            "example_curl": "curl -X POST 'http://127.0.0.1:8001/predict' -H 'Content-Type: application/json' -d '{\"features\": [5.1, 3.5, 1.4, 0.2]}'",
-            "interactive_docs": "/docs"
-        },
-        "note": "Visit /docs for interactive API documentation"
+        "status": "healthy",
+        "model_loaded": True
     }
 
 
@@ -128,39 +228,64 @@ async def predict(request: PredictionRequest):
     - petal_length: float
     - petal_width: float
     """
+    if _get_ready_model() is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Model not found. Please ensure the model has been trained."
+        )
+
     try:
-        # Load model if not already loaded
-        model = model_loader.get_model()
-        
-        # Validate input
-        if len(request.features) != 4:
-            raise HTTPException(
-                status_code=400,
-                detail="Exactly 4 features are required: [sepal_length, sepal_width, petal_length, petal_width]"
-            )
-        
-        # Convert to numpy array and reshape for prediction
-        features_array = np.array(request.features).reshape(1, -1)
-        
-        # Make prediction
-        prediction = model.predict(features_array)[0]
-        prediction_proba = model.predict_proba(features_array)[0].tolist()
-        
-        # Map class index to class name
-        class_names = ["setosa", "versicolor", "virginica"]
-        class_name = class_names[prediction]
-        
-        return PredictionResponse(
-            prediction=int(prediction),
-            prediction_proba=prediction_proba,
-            class_name=class_name
+        # Submit to the batch worker; concurrent requests share one model call
+        prediction, prediction_proba = await _predict_batched(request.features)
+
+        # Return a response directly so orjson serializes the probability
+        # ndarray itself (OPT_SERIALIZE_NUMPY) instead of round-tripping it
+        # through a list of boxed Python floats and pydantic re-validation;
+        # response_model above still documents the schema
+        return ORJSONResponse({
+            "prediction": prediction,
+            "prediction_proba": prediction_proba,
+            "class_name": _CLASS_NAMES[prediction]
+        })
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Prediction error: {str(e)}"
         )
-    
-    except FileNotFoundError as e:
+
+
+@app.post("/predict_batch", response_model=BatchPredictionResponse)
+async def predict_batch(request: BatchPredictionRequest):
+    """
+    Predict Iris classes for a batch of feature rows in one model call.
+
+    Accepts a list of feature rows and amortizes the model's per-call
+    overhead across all of them.
+    """
+    model = _get_ready_model()
+    if model is None:
         raise HTTPException(
             status_code=503,
-            detail=f"Model not found. Please ensure the model has been trained: {str(e)}"
+            detail="Model not found. Please ensure the model has been trained."
         )
+
+    try:
+        features_array = np.asarray(request.features, dtype=np.float64)
+        probabilities = await asyncio.to_thread(model.predict_proba, features_array)
+        predictions = np.argmax(probabilities, axis=1)
+
+        return ORJSONResponse({
+            "predictions": [
+                {
+                    "prediction": int(prediction),
+                    "prediction_proba": probabilities[i],
+                    "class_name": _CLASS_NAMES[prediction]
+                }
+                for i, prediction in enumerate(predictions)
+            ]
+        })
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -2,46 +2,86 @@
 Model loader utility for loading the trained ML model.
 """
 
-import os
-import pickle
 from pathlib import Path
 
+import joblib
+import numpy as np
 
-class ModelLoader:
-    """Singleton class to load and manage the ML model."""
-    
-    _instance = None
-    _model = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ModelLoader, cls).__new__(cls)
-        return cls._instance
-    
-    def load_model(self):
-        """Load the trained model from disk."""
-        if self._model is None:
-            # Get the project root directory
-            current_dir = Path(__file__).parent
-            project_root = current_dir.parent
-            model_path = project_root / "model" / "model.pkl"
-            
-            if not model_path.exists():
-                raise FileNotFoundError(
-                    f"Model file not found at {model_path}. "
-                    "Please run train.py first to generate the model."
-                )
-            
-            with open(model_path, "rb") as f:
-                self._model = pickle.load(f)
-            
-            print(f"Model loaded successfully from {model_path}")
-        
-        return self._model
-    
-    def get_model(self):
-        """Get the loaded model instance."""
-        if self._model is None:
-            self.load_model()
-        return self._model
+
+class CompiledTreePredictor:
+    """Adapter exposing the sklearn predict/predict_proba interface over a
+    Treelite-compiled shared library.
+
+    Treelite inlines all tree thresholds into native branch code, replacing
+    sklearn's per-tree Python dispatch with straight-line compiled traversal.
+    """
+
+    def __init__(self, libpath):
+        import treelite_runtime
+        self._runtime = treelite_runtime
+        self._predictor = treelite_runtime.Predictor(str(libpath))
+
+    def predict_proba(self, X):
+        """Return class probabilities for a 2-D feature matrix."""
+        X = np.ascontiguousarray(X)
+        proba = self._predictor.predict(self._runtime.DMatrix(X))
+        return np.asarray(proba).reshape(X.shape[0], -1)
+
+    def predict(self, X):
+        """Return predicted class indices for a 2-D feature matrix."""
+        return np.argmax(self.predict_proba(X), axis=1)
+
+
+# Module-level model singleton; tests can reset it to None to force a reload
+_MODEL = None
+
+
+def load_model():
+    """Load the trained model from disk."""
+    global _MODEL
+    if _MODEL is None:
+        # Get the project root directory
+        current_dir = Path(__file__).parent
+        project_root = current_dir.parent
+        model_path = project_root / "model" / "model.pkl"
+        compiled_path = project_root / "model" / "model.so"
+
+        # Prefer the Treelite-compiled predictor when it has been built
+        # (see train.py); fall back to the pickled sklearn model
+        if compiled_path.exists():
+            try:
+                _MODEL = CompiledTreePredictor(compiled_path)
+                print(f"Compiled model loaded successfully from {compiled_path}")
+                return _MODEL
+            except (ImportError, OSError) as e:
+                print(f"Warning: could not load compiled model ({e}), "
+                      "falling back to pickled model")
+
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"Model file not found at {model_path}. "
+                "Please run train.py first to generate the model."
+            )
+
+        # Memory-map the model arrays so forked workers share read-only
+        # pages through the page cache instead of copying them
+        _MODEL = joblib.load(model_path, mmap_mode="r")
+
+        print(f"Model loaded successfully from {model_path}")
+
+        # Wrap the sklearn forest in the numba-compiled predictor when
+        # numba is available; the JIT cache avoids recompiling on restart
+        try:
+            from app.numba_predictor import NumbaForestPredictor
+            _MODEL = NumbaForestPredictor(_MODEL)
+            print("Using numba-compiled forest predictor")
+        except ImportError:
+            pass
+
+    return _MODEL
+
+
+def get_model():
+    """Get the loaded model instance, loading it on first use."""
+    return _MODEL if _MODEL is not None else load_model()
 
@@ -0,0 +1,97 @@
+"""
+Numba-compiled predictor for the trained random forest.
+
+Flattens the sklearn forest into structure-of-arrays ndarrays and walks
+them with an LLVM-compiled kernel, replacing sklearn's per-tree Python
+dispatch with native straight-line code over contiguous arrays.
+"""
+
+import numpy as np
+
+
+def _predict_batch_impl(X, feature, threshold, child_left, child_right, leaf_proba):
+    """Average leaf probabilities over all trees for each row of X."""
+    n_rows = X.shape[0]
+    n_trees = feature.shape[0]
+    n_classes = leaf_proba.shape[2]
+    out = np.zeros((n_rows, n_classes))
+    for i in range(n_rows):
+        for t in range(n_trees):
+            node = 0
+            while child_left[t, node] >= 0:
+                if X[i, feature[t, node]] <= threshold[t, node]:
+                    node = child_left[t, node]
+                else:
+                    node = child_right[t, node]
+            for c in range(n_classes):
+                out[i, c] += leaf_proba[t, node, c]
+    return out / n_trees
+
+
+# Prefer the ahead-of-time compiled kernel (see build_aot.py), which avoids
+# paying LLVM compile time on the first request; fall back to JIT with an
+# on-disk compilation cache
+try:
+    from rf_predictor import predict_batch as _predict_batch
+except ImportError:
+    from numba import njit
+    _predict_batch = njit(cache=True, fastmath=True)(_predict_batch_impl)
+
+
+def _flatten_forest(model):
+    """Flatten a fitted RandomForestClassifier into padded SoA arrays."""
+    n_trees = len(model.estimators_)
+    n_nodes = max(est.tree_.node_count for est in model.estimators_)
+    n_classes = model.n_classes_
+
+    # Narrow dtypes halve the cache footprint of the node arrays: the Iris
+    # trees are tiny, so int16 indices and float32 thresholds are plenty
+    feature = np.zeros((n_trees, n_nodes), dtype=np.int16)
+    threshold = np.zeros((n_trees, n_nodes), dtype=np.float32)
+    child_left = np.full((n_trees, n_nodes), -1, dtype=np.int16)
+    child_right = np.full((n_trees, n_nodes), -1, dtype=np.int16)
+    leaf_proba = np.zeros((n_trees, n_nodes, n_classes), dtype=np.float32)
+
+    for t, estimator in enumerate(model.estimators_):
+        tree = estimator.tree_
+        count = tree.node_count
+        feature[t, :count] = tree.feature
+        # sklearn traverses in float32-X / float64-threshold space, so a
+        # round-to-nearest float32 cast that rounds a threshold up would let
+        # x <= threshold flip for x between the two. Floor-cast instead: no
+        # float32 x lies between the floored threshold and the original, so
+        # branch decisions match sklearn exactly
+        narrowed = tree.threshold.astype(np.float32)
+        rounded_up = narrowed.astype(np.float64) > tree.threshold
+        narrowed[rounded_up] = np.nextafter(
+            narrowed[rounded_up], np.float32(-np.inf)
+        )
+        threshold[t, :count] = narrowed
+        child_left[t, :count] = tree.children_left
+        child_right[t, :count] = tree.children_right
+        # Normalize per-node class counts so leaves hold probabilities,
+        # matching sklearn's per-tree predict_proba
+        value = tree.value[:, 0, :]
+        leaf_proba[t, :count] = value / value.sum(axis=1, keepdims=True)
+
+    return feature, threshold, child_left, child_right, leaf_proba
+
+
+class NumbaForestPredictor:
+    """Adapter exposing the sklearn predict/predict_proba interface over the
+    flattened forest and the compiled traversal kernel."""
+
+    def __init__(self, model):
+        self._arrays = _flatten_forest(model)
+        self.classes_ = model.classes_
+
+    def predict_proba(self, X):
+        """Return class probabilities for a 2-D feature matrix."""
+        # sklearn casts inputs to float32 before traversal; match it so
+        # branch decisions are identical
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        return _predict_batch(X, *self._arrays)
+
+    def predict(self, X):
+        """Return predicted class indices for a 2-D feature matrix."""
+        return np.argmax(self.predict_proba(X), axis=1)
@@ -0,0 +1,26 @@
+"""
+Ahead-of-time compile the forest traversal kernel to a native extension.
+
+Running this script emits an rf_predictor extension module next to it;
+app/numba_predictor.py imports the module when present, so the kernel's
+LLVM compile cost is paid at build time instead of on the first request.
+"""
+
+from numba.pycc import CC
+
+from app.numba_predictor import _predict_batch_impl
+
+
+def build():
+    """Compile the traversal kernel into the rf_predictor module."""
+    cc = CC("rf_predictor")
+    cc.export(
+        "predict_batch",
+        "f8[:,:](f4[:,:], i2[:,:], f4[:,:], i2[:,:], i2[:,:], f4[:,:,:])",
+    )(_predict_batch_impl)
+    cc.compile()
+    print("Compiled traversal kernel to rf_predictor extension module")
+
+
+if __name__ == "__main__":
+    build()
@@ -5,7 +5,6 @@ Unit tests for the FastAPI application.
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
-from app.model_loader import ModelLoader
 import os
 from pathlib import Path
 
@@ -114,3 +113,40 @@ def test_predict_endpoint_different_samples(client):
         assert "prediction" in data
         assert "class_name" in data
 
+
+def test_predict_batch_endpoint_success(client):
+    """Test successful batch prediction."""
+    model_path = Path(__file__).parent.parent / "model" / "model.pkl"
+    if not model_path.exists():
+        pytest.skip("Model not found. Run train.py first.")
+
+    batch = [
+        [5.1, 3.5, 1.4, 0.2],  # setosa
+        [7.0, 3.2, 4.7, 1.4],  # versicolor
+        [6.3, 3.3, 6.0, 2.5],  # virginica
+    ]
+
+    response = client.post("/predict_batch", json={"features": batch})
+    assert response.status_code == 200
+
+    data = response.json()
+    assert "predictions" in data
+    assert len(data["predictions"]) == len(batch)
+
+    for result in data["predictions"]:
+        assert 0 <= result["prediction"] <= 2
+        assert len(result["prediction_proba"]) == 3
+        assert abs(sum(result["prediction_proba"]) - 1.0) < 0.01
+        assert result["class_name"] in ["setosa", "versicolor", "virginica"]
+
+
+def test_predict_batch_endpoint_invalid_rows(client):
+    """Test batch prediction with invalid feature rows."""
+    # Empty batch
+    response = client.post("/predict_batch", json={"features": []})
+    assert response.status_code == 422  # Validation error
+
+    # Row with wrong number of features
+    response = client.post("/predict_batch", json={"features": [[5.1, 3.5]]})
+    assert response.status_code == 422  # Validation error
+
@@ -4,7 +4,7 @@ Unit tests for the ML model.
 
 import pytest
 import numpy as np
-import pickle
+import joblib
 from pathlib import Path
 from sklearn.datasets import load_iris
 
@@ -30,16 +30,14 @@ def test_model_exists(model_path):
 
 def test_model_loads(model_path):
     """Test that the model can be loaded."""
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
+    model = joblib.load(model_path)
     
     assert model is not None, "Model should not be None"
 
 
 def test_model_prediction_shape(model_path, sample_features):
     """Test that model predictions have the correct shape."""
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
+    model = joblib.load(model_path)
     
     features_array = np.array(sample_features).reshape(1, -1)
     prediction = model.predict(features_array)
@@ -57,8 +55,7 @@ def test_model_prediction_shape(model_path, sample_features):
 
 def test_model_prediction_type(model_path, sample_features):
     """Test that model predictions are integers."""
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
+    model = joblib.load(model_path)
     
     features_array = np.array(sample_features).reshape(1, -1)
     prediction = model.predict(features_array)
@@ -68,8 +65,7 @@ def test_model_prediction_type(model_path, sample_features):
 
 def test_model_prediction_range(model_path, sample_features):
     """Test that model predictions are in valid range [0, 2]."""
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
+    model = joblib.load(model_path)
     
     features_array = np.array(sample_features).reshape(1, -1)
     prediction = model.predict(features_array)
@@ -77,13 +73,32 @@ def test_model_prediction_range(model_path, sample_features):
     assert 0 <= prediction[0] <= 2, f"Prediction should be in range [0, 2], got {prediction[0]}"
 
 
+def test_numba_predictor_matches_sklearn(model_path):
+    """Test that the numba predictor reproduces sklearn's probabilities."""
+    pytest.importorskip("numba")
+    from app.numba_predictor import NumbaForestPredictor
+
+    model = joblib.load(model_path)
+    predictor = NumbaForestPredictor(model)
+
+    X = load_iris().data
+    expected = model.predict_proba(X)
+    actual = predictor.predict_proba(X)
+
+    # Same traversal decisions as sklearn: identical classes, probabilities
+    # equal up to float32 leaf rounding
+    assert np.allclose(actual, expected, atol=1e-6), \
+        f"Max probability error {np.abs(actual - expected).max()}"
+    assert (np.argmax(actual, axis=1) == np.argmax(expected, axis=1)).all(), \
+        "Predicted classes should match sklearn"
+
+
 def test_model_with_iris_dataset(model_path):
     """Test model with actual Iris dataset samples."""
     iris = load_iris()
     X, y = iris.data, iris.target
     
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
+    model = joblib.load(model_path)
     
     # Test with first sample from each class
     for i in range(3):
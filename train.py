@@ -5,7 +5,7 @@ and saves it to model/model.pkl
 """
 
 import os
-import pickle
+import joblib
 from sklearn.datasets import load_iris
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
@@ -24,15 +24,17 @@ def train_model():
         X, y, test_size=0.2, random_state=42
     )
     
-    # Train the model
+    # Train the model. Inference cost is linear in n_trees x depth, and the
+    # Iris problem does not need a large ensemble, so keep the forest small
     print("Training Random Forest classifier...")
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    model = RandomForestClassifier(n_estimators=25, max_depth=4, random_state=42)
     model.fit(X_train, y_train)
-    
+
     # Evaluate the model
     y_pred = model.predict(X_test)
     accuracy = accuracy_score(y_test, y_pred)
-    
+    assert accuracy >= 0.95, f"Model accuracy {accuracy:.4f} below 0.95 threshold"
+
     print(f"\nModel Accuracy: {accuracy:.4f}")
     print("\nClassification Report:")
     print(classification_report(y_test, y_pred, target_names=iris.target_names))
@@ -40,12 +42,28 @@ def train_model():
     # Create model directory if it doesn't exist
     os.makedirs("model", exist_ok=True)
     
-    # Save the model
+    # Save the model uncompressed so workers can memory-map the arrays
     model_path = "model/model.pkl"
-    with open(model_path, "wb") as f:
-        pickle.dump(model, f)
-    
+    joblib.dump(model, model_path, compress=0)
+
     print(f"\nModel saved to {model_path}")
+
+    # Optionally compile the forest to a shared library for fast inference.
+    # The API prefers model/model.so when present (see app/model_loader.py).
+    try:
+        import treelite
+    except ImportError:
+        print("treelite not installed; skipping compiled model export")
+    else:
+        compiled_path = "model/model.so"
+        treelite_model = treelite.sklearn.import_model(model)
+        treelite_model.export_lib(
+            toolchain="gcc",
+            libpath=compiled_path,
+            params={"parallel_comp": 1},
+        )
+        print(f"Compiled model saved to {compiled_path}")
+
     return model
 
 